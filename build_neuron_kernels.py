@@ -0,0 +1,41 @@
+#--------------------------------------------------------------------------------------------
+# Title:        Build Neuron Kernels
+# Description:  Compiles the kernels in neuron_kernels.py ahead of time into the
+#               neuron_kernels_aot extension module, so the demos start without any JIT
+#               compilation and run at full speed on machines without numba.
+# Author:       Prof. Patrick Degenaar
+# Date:         2026-10-15
+# Version:      1.0
+# Usage:        Run once with numba installed (and a C compiler available). The extension is
+#               written next to this script, where the demos pick it up automatically.
+#               numba.pycc is pending deprecation in numba and warns on import (0.68); without
+#               the extension the demos fall back to the JIT compiled kernels.
+# License:      Creative Commons Attribution-NonCommercial-ShareAlike 4.0 International License
+#--------------------------------------------------------------------------------------------
+
+import os
+
+from numba.pycc import CC
+
+import neuron_kernels
+
+# --------------------------------------------------------------------------------------------
+# Define the exported kernels
+# --------------------------------------------------------------------------------------------
+
+# The compiled functions only accept these exact types - float32 signals, int32 spike times and
+# float64 scalars - and do not check them, so neuron_common wraps them to coerce their inputs
+cc = CC('neuron_kernels_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('iaf_spike_times',  'i4[:](f4[:], f8)')(neuron_kernels.iaf_spike_times.py_func)
+cc.export('ttfs_spike_times', 'i4[:](f4[:], f8)')(neuron_kernels.ttfs_spike_times.py_func)
+cc.export('scatter_pulses',   'void(i4[:], f4[:], f4[:])')(neuron_kernels.scatter_pulses.py_func)
+cc.export('ap_pulse',         'f4[:](f8[:], f8, f8, f8, f8)')(neuron_kernels.ap_pulse.py_func)
+
+# --------------------------------------------------------------------------------------------
+# Run the program
+# --------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    cc.compile()
@@ -0,0 +1,298 @@
+#--------------------------------------------------------------------------------------------
+# Title:        Neuron Demo Common Functions
+# Description:  Signal generation, spike coding and animation functions shared by the neuron
+#               coding demos of the EEE8116 Bioelectronics MSc/MEng module at Newcastle
+#               University.
+# Author:       Prof. Patrick Degenaar
+# Date:         2026-10-15
+# Version:      1.0
+# Usage:        Imported by neuron_demo.py, which sets the parameters of each demo.
+# License:      Creative Commons Attribution-NonCommercial-ShareAlike 4.0 International License
+#--------------------------------------------------------------------------------------------
+
+import hashlib
+import os
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation, FFMpegWriter, PillowWriter
+
+# Use the ahead-of-time compiled kernels when they have been built with build_neuron_kernels.py,
+# otherwise the JIT compiled (or plain Python, without numba) versions
+try:
+    import neuron_kernels_aot
+except ImportError:
+    from neuron_kernels import ap_pulse, iaf_spike_times, scatter_pulses, ttfs_spike_times
+    from neuron_kernels import numbaAvailable as kernelsCompiled
+else:
+    kernelsCompiled = True
+
+    # The compiled kernels only accept the exact types they were exported with and do not check them -
+    # anything else crashes Python or returns garbage - so coerce the inputs first, as the JIT versions
+    # would accept any array
+    def iaf_spike_times(info, threshold):
+        return neuron_kernels_aot.iaf_spike_times(np.ascontiguousarray(info, np.float32), float(threshold))
+
+    def ttfs_spike_times(info, threshold):
+        return neuron_kernels_aot.ttfs_spike_times(np.ascontiguousarray(info, np.float32), float(threshold))
+
+    def scatter_pulses(occ, pulse, out):
+
+        # the pulses are written in place, so copy them back if out had to be converted
+        outBuf = np.ascontiguousarray(out, np.float32)
+        neuron_kernels_aot.scatter_pulses(np.ascontiguousarray(occ, np.int32),
+                                          np.ascontiguousarray(pulse, np.float32), outBuf)
+        if outBuf is not out:
+            out[:] = outBuf
+
+    def ap_pulse(t, posAmp, negAmp, posWidth, negWidth):
+        return neuron_kernels_aot.ap_pulse(np.ascontiguousarray(t, np.float64), float(posAmp), float(negAmp),
+                                           float(posWidth), float(negWidth))
+
+# --------------------------------------------------------------------------------------------
+# Define the information signals
+# --------------------------------------------------------------------------------------------
+
+# we will represent the information signal as a simple sine wave - This can be changed to any
+# arbitrary function that represents an information signal
+def information_signal_sine(t, F):
+
+    # angular frequency per ms, so the only array-sized work is one multiply and one sine
+    omega = 2 * np.pi * F / 1000
+
+    # 0.5 + 0.5*sin(omega*t), computed in place in a single float32 buffer with no temporaries
+    informationSig = np.empty(len(t), dtype=np.float32)
+    np.multiply(t, omega, out=informationSig)
+    np.sin(informationSig, out=informationSig)
+    informationSig *= 0.5
+    informationSig += 0.5
+
+    return informationSig
+
+
+# we will represent the information as a sequence of pulses with increasing amplitude
+def information_signal_pulses(decayCoeff):
+
+    pulseInterval   = 800
+    PulseTime       = 1200
+    numPulses       = 4
+
+    # each repetition is a zero interval followed by a pulse, with one more zero interval at the end
+    period = pulseInterval + PulseTime
+    total  = numPulses * period + pulseInterval
+
+    informationSig      = np.zeros(total, dtype=np.float32)
+    informationSigDecay = np.zeros(total, dtype=np.float32)
+
+    # pulse amplitudes increase with each repetition
+    amps = np.arange(1, numPulses+1) / numPulses
+
+    # decay the signal - a single kernel shared by every pulse
+    decayKernel = np.exp(-decayCoeff * np.arange(PulseTime))
+
+    # view the repetitions as rows so every pulse is written in one broadcast assignment
+    pulses      = informationSig[:numPulses*period].reshape(numPulses, period)
+    pulsesDecay = informationSigDecay[:numPulses*period].reshape(numPulses, period)
+    pulses[:, pulseInterval:]      = amps[:, None]
+    pulsesDecay[:, pulseInterval:] = decayKernel[None, :] * np.sqrt(amps)[:, None]
+
+    return informationSig, informationSigDecay
+
+# --------------------------------------------------------------------------------------------
+# Define the spike coding
+# --------------------------------------------------------------------------------------------
+
+# Find the spike times of a non-negative signal from its running integral. After a spike at sample s the
+# integral restarts, so the next spike is the first sample where the running integral has grown by the
+# threshold since s - one binary search per spike instead of a step for every sample. This only beats the
+# sample by sample kernels when they run as plain Python, so it is used just when numba is missing
+def _spike_times(cumInfo, threshold):
+
+    occ   = np.empty(int(cumInfo[-1] // threshold) + 1, np.int32)
+    count = 0
+
+    i = np.searchsorted(cumInfo, threshold)
+    while i < len(cumInfo):
+        occ[count] = i
+        count += 1
+        i = np.searchsorted(cumInfo, cumInfo[i] + threshold)
+
+    return occ[:count]
+
+
+# Convert the information signal to action potentials using an integrate and fire method
+def integrate_and_fire(informationSig, singlePulse, AP_threshold):
+
+    # Convert the information signal to action potentials by obtaining the times of action potentials -
+    # sample by sample in the compiled kernel, or searched on the running integral when the kernel runs as
+    # plain Python and the signal is non-negative
+    if not kernelsCompiled and AP_threshold > 0 and informationSig.min() >= 0:
+        AP_Occurance = _spike_times(np.cumsum(informationSig, dtype=np.float64), AP_threshold)
+    else:
+        AP_Occurance = iaf_spike_times(informationSig, AP_threshold)
+
+    # Start with a zero action potential signal the same length as the information signal and place a
+    # pulse at each spike time - the zeros already cover the gaps
+    ApSig = np.zeros(len(informationSig), dtype=np.float32)
+    scatter_pulses(AP_Occurance, singlePulse, ApSig)
+
+    return ApSig
+
+
+# Convert the information signal to action potentials
+# This is done in two passes - first find the spike times, then write the pulses at those times
+def timeToFirstSpike(informationSig, singlePulse, AP_threshold):
+
+    # Pass 1: obtain the times of the action potentials as a dense array of sample indices - sample by
+    # sample in the compiled kernel, or, when the kernel runs as plain Python, by searching each positive
+    # stretch of the signal on its own running integral, since the integral resets whenever the stimulus
+    # drops to zero
+    if not kernelsCompiled and AP_threshold > 0:
+        positive = np.concatenate(([0], informationSig > 0, [0])).astype(np.int8)
+        edges    = np.flatnonzero(np.diff(positive))
+
+        spikeTimes = [np.empty(0, np.int32)]
+        for start, end in zip(edges[::2], edges[1::2]):
+            cumInfo = np.cumsum(informationSig[start:end], dtype=np.float64)
+            spikeTimes.append(start + _spike_times(cumInfo, AP_threshold))
+        AP_Occurance = np.concatenate(spikeTimes).astype(np.int32, copy=False)
+    else:
+        AP_Occurance = ttfs_spike_times(informationSig, AP_threshold)
+
+    # Pass 2: start with a zero action potential signal the same length as the information signal and
+    # place a pulse at each spike time - the zeros already cover the gaps
+    ApSig = np.zeros(len(informationSig), dtype=np.float32)
+    scatter_pulses(AP_Occurance, singlePulse, ApSig)
+
+    return ApSig
+
+
+# Define the Action Potential pulse function
+# This function uses a short Gaussian pulse for both positive and negative phases of the action potential
+def AP_SinglePulse(AP_Duration, AP_PosAmplitude, AP_NegAmplitude, AP_PosWidth, AP_NegWidth):
+
+    # time sequence for the action potential (ms) - sampled at the 1 ms resolution of the simulation
+    AP_timeBase = np.arange(AP_Duration, dtype=np.float64)
+
+    # Create the action potential pulse from positive and negative Gaussian pulses
+    return ap_pulse(AP_timeBase, AP_PosAmplitude, AP_NegAmplitude, AP_PosWidth, AP_NegWidth)
+
+
+# Load the signals from the on-disk cache of a previous run with the same parameters, or build and
+# cache them if this is the first run. The source of this module and of the kernels is part of the
+# key, so editing the code that builds the signals never serves stale arrays from an older version
+def cached_signals(params, build, useCache=True):
+
+    codeDir = os.path.dirname(os.path.abspath(__file__))
+
+    key = hashlib.md5(repr(params).encode())
+    for source in ('neuron_common.py', 'neuron_kernels.py'):
+        with open(os.path.join(codeDir, source), 'rb') as f:
+            key.update(f.read())
+    cacheFile = os.path.join(codeDir, f'.cache_{key.hexdigest()[:8]}.npz')
+
+    if useCache and os.path.exists(cacheFile):
+        with np.load(cacheFile) as cached:
+            return tuple(cached[name] for name in cached.files)
+
+    signals = build()
+    if useCache:
+        np.savez(cacheFile, *signals)
+
+    return signals
+
+# --------------------------------------------------------------------------------------------
+# Define the animation
+# --------------------------------------------------------------------------------------------
+
+# Precompute the line data for every frame of the animation
+# Each frame only depends on the frame number, so the visible window slices (views, not copies) are
+# built once and the animation simply indexes into them when playing, looping or saving
+def animation_frames(informationSig, AP_Stream, numFrames, animationSpeed, windowLength):
+
+    # Fixed time base for the visible window - the animation slides the signals through it
+    t_window = np.arange(windowLength + 1)
+
+    frames = []
+    for i in range(numFrames):
+
+        # Move the window start to the right by a certain amount, according to the animation speed
+        start = i * animationSpeed
+        end   = start + windowLength + 1
+
+        # The slices are shorter than the window once it runs off the end of the signals
+        infoWindow = informationSig[start:end]
+        frames.append((t_window[:len(infoWindow)], infoWindow, AP_Stream[start:end]))
+
+    return frames
+
+
+# Choose the writer for saving the animation from the file extension - ffmpeg for .mp4 video, pillow
+# for GIFs. Returns None for .mp4 when ffmpeg is not installed, so the caller can skip the save before
+# any frame is rendered
+def animation_writer(path, fps=25):
+
+    if os.path.splitext(path)[1].lower() == '.mp4':
+        if not FFMpegWriter.isAvailable():
+            return None
+        return FFMpegWriter(fps=fps, codec='libx264')
+
+    return PillowWriter(fps=fps)
+
+
+# Set up the figure and axis - the information signal on top and the action potentials below
+# The action potential axis is scaled to the pulse, so the whole waveform stays visible
+def setup_figure(windowLength, singlePulse):
+
+    fig = plt.figure(figsize=(8, 6))
+
+    # Create a subplot and plot some data
+    (ax1, ax2) = fig.subplots(2, 1)
+
+    ax1.set_ylabel('Information value')      # Set y-axis label
+    ax1.set_xlim(0, windowLength)            # Adjust x-axis limits to the visible window (milliseconds)
+    ax1.set_ylim(0, 1)                       # Adjust y-axis limits to 0 to 1 (arbitrary units)
+
+    # Remove the spines (figure box)
+    ax1.spines['top'].set_visible(False)
+    ax1.spines['right'].set_visible(False)
+    ax1.spines['bottom'].set_visible(False)
+    ax1.spines['left'].set_visible(True)
+    ax1.set_xticks([])                       # Hide x-axis ticks and labels
+    ax1.set_yticks([])                       # Hide x-axis ticks and labels
+
+    ax2.set_xlabel('time (ms)')              # Set the x-axis label for the bottom plot
+    ax2.set_ylabel('Amplitude')              # Set the y-axis label for the bottom plot
+    ax2.set_xlim(0, windowLength)            # Adjust x-axis limits to the visible window (milliseconds)
+    margin = 0.1 * (singlePulse.max() - singlePulse.min())
+    ax2.set_ylim(singlePulse.min() - margin, singlePulse.max() + margin)  # Fit the pulse plus a 10% margin (arbitrary units)
+
+    # Remove the spines (figure box)
+    ax2.spines['top'].set_visible(False)
+    ax2.spines['right'].set_visible(False)
+    ax2.spines['bottom'].set_visible(True)
+    ax2.spines['left'].set_visible(True)
+    ax2.set_yticks([])                       # Hide x-axis ticks and labels
+
+    line1, = ax1.plot([], [], color='red',linestyle='dotted', lw=2)  # Create a line object
+    line2, = ax2.plot([], [], color='black', lw=2)                   # Create a line object
+
+    return fig, line1, line2
+
+
+# Create the animation of the precomputed frames on the two lines
+def create_animation(fig, line1, line2, frameData, frameInterval):
+
+    # Animation function
+    # This function will be called for each frame of the animation
+    # It slides the visible window to the right by a certain amount, so only the visible samples are drawn
+    def animate(i):
+
+        # Update the line data which then gets plotted by the animation function
+        t_window, infoWindow, apWindow = frameData[i]
+        line1.set_data(t_window, infoWindow)
+        line2.set_data(t_window, apWindow)
+
+        return line1, line2
+
+    return FuncAnimation(fig, animate, len(frameData), interval=frameInterval, blit=True)
@@ -0,0 +1,173 @@
+#--------------------------------------------------------------------------------------------
+# Title:        Neuron Coding Demo
+# Description:  This script demonstrates the concepts of inter-spike and latency coding in
+#               neurons as part of the EEE8116 Bioelectronics MSc/MEng module at Newcastle
+#               University.
+# Author:       Prof. Patrick Degenaar
+# Date:         2026-10-15
+# Version:      1.0
+# Usage:        python neuron_demo.py --mode interspike latency
+#               Run the script and observe the animation of the information signal and the
+#               action potential signal for each chosen demo. Running both together shares the
+#               imports, compiled kernels and pulse between them. --save-only writes each
+#               animation to its saveDirectory without opening a window.
+# License:      Creative Commons Attribution-NonCommercial-ShareAlike 4.0 International License
+#--------------------------------------------------------------------------------------------
+
+import argparse
+import inspect
+import os
+import warnings
+
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+
+from neuron_common import (AP_SinglePulse, animation_frames, animation_writer, cached_signals,
+                           create_animation, information_signal_pulses, information_signal_sine,
+                           integrate_and_fire, setup_figure, timeToFirstSpike)
+
+# --------------------------------------------------------------------------------------------
+# Define the parameters
+# --------------------------------------------------------------------------------------------
+
+# Action Potential variables - shared by both demos
+useCache            = True             # Reuse the signals saved by a previous run with the same parameters
+AP_Duration         = 5                # Time period for the action potential (ms)
+AP_PosAmplitude     = 4                # Positive amplitude of the action potential
+AP_NegAmplitude     = -0.4             # Negative amplitude of the action potential
+AP_PosWidth         = 0.35             # Positive width of the action potential
+AP_NegWidth         = 0.75             # Negative width of the action potential
+
+# Inter-spike coding demo - a sine wave information signal coded by integrate and fire
+interSpikeParams = dict(
+    animationSpeed  = 4,               # Speed of the animation - the number of shifts on the x-axis per frame
+    numFrames       = 1000,            # Number of frames in the animation - too few and it will start to repeat early
+    frameInterval   = 5,               # Time interval between frames in milliseconds - sets the FPS of the animation?
+    windowLength    = 1000,            # Width of the visible time window (ms)
+    saveDirectory   = 'F:/OneDrive_files/Newcastle University/Neuroprosthesis lab - General/Code - Python/Teaching simulations/InterSpikeCoding.gif',
+    saveAnimation   = False,           # Save the animation to saveDirectory (.gif uses pillow, .mp4 uses ffmpeg)
+    simLength       = 20001,           # Length of the simulation (ms)
+    sineFrequency   = 1.5,             # Frequency of the sine wave
+    AP_threshold    = 30,              # Threshold for the action potential
+)
+
+# Latency coding demo - a sequence of decaying pulses coded by the time to first spike
+latencyParams = dict(
+    animationSpeed  = 15,              # Speed of the animation - the number of shifts on the x-axis per frame
+    numFrames       = 600,             # Number of frames in the animation - too few and it will start to repeat early
+    frameInterval   = 20,              # Time interval between frames in milliseconds - sets the FPS of the animation?
+    windowLength    = 2000,            # Width of the visible time window (ms)
+    saveDirectory   = 'F:/OneDrive_files/Newcastle University/Neuroprosthesis lab - General/Code - Python/Teaching simulations/LatencyCoding.gif',
+    saveAnimation   = True,            # Save the animation to saveDirectory (.gif uses pillow, .mp4 uses ffmpeg)
+    decayCoeff      = 0.001,           # Decay coefficient of the information pulses
+    AP_threshold    = 100,             # Threshold for the action potential
+)
+
+# --------------------------------------------------------------------------------------------
+# Define the Functions
+# --------------------------------------------------------------------------------------------
+
+# Build the information signal and the action potential series for the inter-spike demo
+# The signals are float32 - ample precision for the plots, at half the memory traffic of float64
+def build_interspike(p, singlePulse):
+
+    # Define the information signal on the fundamental time base for the simulation (1 ms steps)
+    timeBase       = np.arange(p['simLength'], dtype=np.float64)
+    informationSig = information_signal_sine(timeBase, p['sineFrequency'])
+
+    # Create the action potential series
+    AP_Stream = integrate_and_fire(informationSig, singlePulse, p['AP_threshold'])
+
+    return informationSig, AP_Stream
+
+
+# Build the information signal and the action potential series for the latency demo - the spikes are
+# driven by the decaying version of the information signal
+def build_latency(p, singlePulse):
+
+    # Define the information signal
+    informationSig, informationSigDecay = information_signal_pulses(p['decayCoeff'])
+
+    # Create the action potential series
+    AP_Stream = timeToFirstSpike(informationSigDecay, singlePulse, p['AP_threshold'])
+
+    return informationSig, AP_Stream
+
+
+# Parameters of the demos that shape the signals, rather than the animation
+signalKeys = ('simLength', 'sineFrequency', 'decayCoeff', 'AP_threshold')
+
+demos = {
+    'interspike': (interSpikeParams, build_interspike),
+    'latency':    (latencyParams,    build_latency),
+}
+
+
+# Build, animate and optionally save one demo - returns the animation, which must be kept alive
+# until the window is closed
+def run_demo(mode, singlePulse, saveOnly=False):
+
+    p, build = demos[mode]
+
+    # Build the information signal and the action potential series, or load them from the cache. Only the
+    # parameters that shape the signals and the source of the build function are in the cache key, so
+    # changing the animation still hits it
+    signalParams = (mode, [p.get(key) for key in signalKeys], AP_Duration, AP_PosAmplitude, AP_NegAmplitude,
+                    AP_PosWidth, AP_NegWidth, inspect.getsource(build))
+    informationSig, AP_Stream = cached_signals(signalParams, lambda: build(p, singlePulse), useCache)
+
+    # Precompute the data for every frame of the animation
+    frameData = animation_frames(informationSig, AP_Stream, p['numFrames'], p['animationSpeed'],
+                                 p['windowLength'])
+
+    # Create the animation
+    fig, line1, line2 = setup_figure(p['windowLength'], singlePulse)
+    ani = create_animation(fig, line1, line2, frameData, p['frameInterval'])
+
+    # save the animation - skipped with a warning if the folder does not exist on this machine or there is
+    # no writer for the format, so one demo's save path cannot stop the others from running
+    if p['saveAnimation'] or saveOnly:
+        saveFolder = os.path.dirname(p['saveDirectory']) or '.'
+        writer     = animation_writer(p['saveDirectory'])
+        if not os.path.isdir(saveFolder):
+            warnings.warn(f'Not saving the {mode} animation - the folder {saveFolder} does not exist')
+        elif writer is None:
+            warnings.warn(f'Not saving the {mode} animation - .mp4 needs ffmpeg installed, or save as .gif')
+        else:
+            ani.save(p['saveDirectory'], writer=writer)
+
+    return ani
+
+
+# Parse the command line and run the chosen demos
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description='Neuron inter-spike and latency coding demos')
+    parser.add_argument('--mode', nargs='+', choices=sorted(demos), default=sorted(demos),
+                        help='which demos to run (default: all)')
+    parser.add_argument('--save-only', action='store_true',
+                        help='save the animations without displaying them')
+    args = parser.parse_args(argv)
+
+    # Saving without displaying needs no GUI, so skip the interactive backend and its per-frame compositing
+    if args.save_only:
+        matplotlib.use('Agg')
+
+    # Define a single action potential pulse, shared by every demo
+    singlePulse = AP_SinglePulse(AP_Duration, AP_PosAmplitude, AP_NegAmplitude, AP_PosWidth, AP_NegWidth)
+
+    animations = [run_demo(mode, singlePulse, args.save_only) for mode in args.mode]
+
+    # Display the animations
+    if not args.save_only:
+        plt.show()
+
+    return animations
+
+# --------------------------------------------------------------------------------------------
+# Run the program
+# --------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()